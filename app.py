@@ -1,32 +1,144 @@
 # PE Ownership Checker (Streamlit Cloud–friendly, hardened)
-import re, time, random
-from functools import lru_cache
+import os, re, time, random, tempfile, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 
+from cachetools import TTLCache
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import streamlit as st
 
+try:
+    import ahocorasick  # optional: single-pass scan for known PE firm names
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # optional: DFA scan for PE_KEYWORDS over long article text
+except ImportError:
+    hyperscan = None
+
 WIKI_API = "https://en.wikipedia.org/w/api.php"
 WIKI_BASE = "https://en.wikipedia.org/wiki/"
 USER_AGENT = "PEOwnershipChecker/1.0 (https://streamlit.app; contact: example@example.com)"
+MAX_WORKERS = 8
+HTML_PARSER = "lxml"  # C-backed; much faster than "html.parser" on full article HTML
+CACHE_TTL = 3600  # seconds, for both the on-disk HTTP cache and st.cache_data
+CACHE_STALE = 24 * 3600  # seconds past expiry an on-disk entry may be served while Wikipedia errors
+CACHE_PATH = os.path.join(tempfile.gettempdir(), "wiki_cache.sqlite")
 
 # ---------- HTTP helper with User-Agent + robust retry/backoff ----------
+class _RateLimiter:
+    """Sliding-window limiter: at most `rate` requests per `per` seconds, across threads."""
+    def __init__(self, rate: int = 8, per: float = 1.0):
+        self.rate, self.per = rate, per
+        self.stamps = deque()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.stamps and now - self.stamps[0] >= self.per:
+                    self.stamps.popleft()
+                if len(self.stamps) < self.rate:
+                    self.stamps.append(now)
+                    return
+                delay = self.per - (now - self.stamps[0])
+            time.sleep(delay)
+
+class _PoliteAdapter(HTTPAdapter):
+    """Rate-limits requests that actually go on the wire (cache hits never reach the adapter)."""
+    def __init__(self, limiter: _RateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.wait()  # be gentle to the API
+        return super().send(request, **kwargs)
+
+def _cacheable(r: requests.Response) -> bool:
+    """MediaWiki reports API errors (maxlag, ratelimited, ...) as HTTP 200; keep those out of the cache."""
+    if "MediaWiki-API-Error" in r.headers:
+        return False
+    if b'"error"' not in r.content:  # cheap pre-check before decoding
+        return True
+    try:
+        data = orjson.loads(r.content)
+    except ValueError:
+        return False
+    return not (isinstance(data, dict) and "error" in data)
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    One pooled keep-alive session per server process, shared by all threads and reruns
+    (retries are handled below), backed by an on-disk response cache that survives restarts.
+    Expired entries are still served for up to CACHE_STALE if Wikipedia is erroring.
+    """
+    s = requests_cache.CachedSession(
+        CACHE_PATH, backend="sqlite", expire_after=CACHE_TTL, allowable_codes=(200,),
+        filter_fn=_cacheable, stale_if_error=CACHE_STALE,
+    )
+    s.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"})
+    s.mount("https://", _PoliteAdapter(_RateLimiter(rate=8, per=1.0), pool_connections=16, pool_maxsize=16, max_retries=0))
+    return s
+
+@st.cache_resource
+def _purge_state() -> Tuple[threading.Lock, Dict[str, float]]:
+    """Process-wide, like the session: when the on-disk cache was last purged."""
+    return threading.Lock(), {"last": float("-inf")}
+
+def _purge_cache():
+    """Drop entries too old to be served even as stale, at most once per CACHE_TTL, so /tmp stays bounded."""
+    lock, state = _purge_state()
+    now = time.monotonic()
+    with lock:
+        if now - state["last"] < CACHE_TTL:
+            return
+        state["last"] = now
+    try:
+        get_session().cache.delete(older_than=CACHE_TTL + CACHE_STALE)
+    except Exception:
+        pass  # housekeeping only; never fail a lookup over it
+
+# In-process cache for results st.cache_data can't hold cheaply (it pickles every value),
+# e.g. parsed soups. One TTL+LRU cache for all of them, keyed by (namespace, args...).
+# A soup is several times larger than its HTML, so the entry cap stays small.
+SHARED_CACHE_SIZE = 32
+
+@st.cache_resource
+def _shared_cache() -> Tuple[TTLCache, threading.Lock]:
+    """Process-wide, since module globals are reset on every rerun."""
+    return TTLCache(maxsize=SHARED_CACHE_SIZE, ttl=CACHE_TTL), threading.Lock()
+
+def cache_call(key: Tuple, fn, *args):
+    """fn(*args), memoized in the shared cache under `key` (a namespaced tuple)."""
+    cache, lock = _shared_cache()
+    with lock:
+        if key in cache:
+            return cache[key]
+    # Compute outside the lock so other threads aren't serialized behind a fetch.
+    value = fn(*args)
+    with lock:
+        cache[key] = value
+    return value
+
 def _http_get(url, params=None, timeout=20, max_retries=5):
     """
     Polite Wikipedia requests with a UA and exponential backoff.
     Retries on 403/429/5xx and network exceptions.
     """
+    _purge_cache()
     backoff = 0.8
     last_exc = None
     for attempt in range(max_retries):
         try:
-            r = requests.get(
-                url,
-                params=params or {},
-                headers={"User-Agent": USER_AGENT},
-                timeout=timeout,
-            )
+            r = get_session().get(url, params=params or {}, timeout=timeout)
             r.raise_for_status()
             return r
         except requests.HTTPError as e:
@@ -47,6 +159,10 @@ def _http_get(url, params=None, timeout=20, max_retries=5):
     if last_exc:
         raise last_exc
 
+def _json(r: requests.Response):
+    """Decode a response with orjson, straight from the raw bytes."""
+    return orjson.loads(r.content)
+
 # ---------- PE heuristics ----------
 KNOWN_PE_FIRMS = {
     "blackstone", "kkr", "carlyle", "apollo global", "tpg capital", "advent international",
@@ -56,219 +172,426 @@ KNOWN_PE_FIRMS = {
     "sun capital", "centerbridge", "apax partners", "new mountain capital", "hellman and friedman"
 }
 
+# Lowercase on purpose: every haystack is lowercased once before matching.
 PE_KEYWORDS = [
-    r"private[-\s]?equity", r"leveraged buyout", r"LBO", r"buyout firm", r"PE-backed", r"PE backed",
-    r"taken private", r"owner[s]?:?\s+[A-Z][A-Za-z&\s]+(Capital|Partners|Equity)"
+    r"private[-\s]?equity", r"leveraged buyout", r"lbo", r"buyout firm", r"pe-backed", r"pe backed",
+    r"taken private", r"owner[s]?:?\s+[a-z][a-z&\s]+(capital|partners|equity)"
 ]
 
+# Longest names first, so e.g. "hellman and friedman" is checked before shorter names.
+_PE_FIRMS_SORTED = tuple(sorted(KNOWN_PE_FIRMS, key=lambda f: (-len(f), f)))
+
+# All keywords as one alternation, so each haystack is scanned once.
+PE_RX = re.compile("|".join(f"(?:{k})" for k in PE_KEYWORDS))
+
+def _build_pe_hs_db():
+    """PE_KEYWORDS compiled into a Hyperscan database, or None if Hyperscan can't be used here."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[k.encode() for k in PE_KEYWORDS],
+            ids=list(range(len(PE_KEYWORDS))),
+            # UTF8 + UCP so \s also matches non-breaking spaces, as it does with `re`
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(PE_KEYWORDS),
+        )
+        return db
+    except hyperscan.error:  # e.g. a CPU without the instruction sets Hyperscan needs
+        return None
+
+def _build_pe_firms_ac():
+    """Aho-Corasick automaton over KNOWN_PE_FIRMS, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    ac = ahocorasick.Automaton()
+    for firm in KNOWN_PE_FIRMS:
+        ac.add_word(firm, firm)
+    ac.make_automaton()
+    return ac
+
+@st.cache_resource
+def _pe_matchers():
+    """
+    Built once per process rather than on every rerun: (firm automaton, keyword database,
+    per-thread Hyperscan scratch holder, since scratch space can't be shared by concurrent scans).
+    """
+    return _build_pe_firms_ac(), _build_pe_hs_db(), threading.local()
+
+PE_FIRMS_AC, PE_HS_DB, _hs_local = _pe_matchers()
+
+# "List of ... companies" pages linked from an article
+LIST_RX = re.compile(r"^list of [^:]*\bcompanies\b", re.IGNORECASE)
+
 # ---------- Wikipedia helpers ----------
-@lru_cache(maxsize=256)
-def wiki_search(query: str) -> Optional[str]:
-    """Find the best Wikipedia page title for a company name; never raises."""
+@st.cache_data(ttl=CACHE_TTL, max_entries=256, show_spinner=False)
+def _wiki_search_cached(query: str) -> str:
+    """Best page title for `query`. Raises when nothing is found, so failures are never cached."""
+    last_exc = None
     # Try OpenSearch first
     try:
         params = {"action": "opensearch", "search": query, "limit": 1, "namespace": 0, "format": "json"}
         r = _http_get(WIKI_API, params=params, timeout=15)
-        data = r.json()
+        data = _json(r)
         if data and len(data) >= 2 and data[1]:
             return data[1][0]
-    except Exception:
-        pass  # fall through
+    except Exception as e:
+        last_exc = e  # fall through
 
     # Fallback: 'query' search API
     try:
         params2 = {"action": "query", "list": "search", "srsearch": query, "srlimit": 1, "format": "json"}
         r2 = _http_get(WIKI_API, params=params2, timeout=20)
-        data2 = r2.json()
+        data2 = _json(r2)
         hits = data2.get("query", {}).get("search", [])
-        if hits:
-            return hits[0].get("title")
-    except Exception:
-        pass
+        if hits and hits[0].get("title"):
+            return hits[0]["title"]
+    except Exception as e:
+        last_exc = e
 
-    return None
+    raise LookupError(f"No Wikipedia page found for {query!r}") from last_exc
+
+def wiki_search(query: str) -> Optional[str]:
+    """Find the best Wikipedia page title for a company name; never raises."""
+    try:
+        return _wiki_search_cached(query)
+    except Exception:
+        return None
 
-@lru_cache(maxsize=256)
-def wiki_page_html(title: str) -> str:
-    params = {"action": "parse", "page": title, "prop": "text|categories|links", "format": "json", "redirects": 1}
+def wiki_page_parse(title: str) -> Dict:
+    """
+    The action=parse object with the rendered HTML in ["text"]["*"].
+    Deliberately not cached in-process: get_page_soup keeps the parsed soup instead.
+    """
+    params = {"action": "parse", "page": title, "prop": "text", "format": "json", "redirects": 1}
     r = _http_get(WIKI_API, params=params, timeout=20)
-    data = r.json()
+    data = _json(r)
     if "parse" not in data:
         raise ValueError(f"Page not found: {title}")
-    return data["parse"]["text"]["*"]
+    return data["parse"]
+
+BULK_CHUNK = 20  # TextExtracts returns at most 20 intro extracts per query
+SUMMARY_PROPS = {
+    "prop": "extracts|categories|pageprops|revisions",
+    "rvprop": "content",  # wikitext: infobox params + body, like the full-page check sees
+    "rvslots": "main",
+    "exintro": 1,
+    "explaintext": 1,
+    "exlimit": "max",
+    "cllimit": "max",
+    "clshow": "!hidden",
+    "format": "json",
+}
+# One page in full, for the seed check: whole plaintext body, wikitext for the infobox,
+# and its article links, so no HTML has to be fetched or parsed.
+PAGE_PROPS = {
+    "prop": "extracts|categories|revisions|links",
+    "rvprop": "content",
+    "rvslots": "main",
+    "explaintext": 1,
+    "exlimit": 1,
+    "cllimit": "max",
+    "clshow": "!hidden",
+    "plnamespace": 0,
+    "pllimit": "max",
+    "format": "json",
+}
 
-@lru_cache(maxsize=256)
-def wiki_page_metadata(title: str) -> Dict:
-    params = {"action": "parse", "page": title, "prop": "categories|links", "format": "json", "redirects": 1}
-    r = _http_get(WIKI_API, params=params, timeout=20)
-    data = r.json()
-    return data.get("parse", {})
+def _query_pages(params: Dict, limit: Optional[int] = None, max_rounds: int = 5,
+                 props: Dict = SUMMARY_PROPS) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """
+    Run a query for `props`, following continuation and merging per-page results.
+    Returns (records keyed by resolved title, {requested/normalized title: target}).
+    With a generator, stops advancing it once `limit` pages are complete.
+    """
+    pages, alias = {}, {}
+    params = {"action": "query", **props, **params}
+    for _ in range(max_rounds):
+        data = _json(_http_get(WIKI_API, params=params, timeout=20))
+        q = data.get("query", {})
+        for n in q.get("normalized", []) + q.get("redirects", []):
+            alias[n["from"]] = n["to"]
+        for p in q.get("pages", {}).values():
+            if "missing" in p or "invalid" in p or "redirect" in p:
+                continue  # redirect stubs have no article text of their own
+            page = pages.setdefault(p["title"], {"title": p["title"], "extract": "", "wikitext": "", "categories": [], "links": [], "pageprops": {}})
+            page["extract"] = p.get("extract") or page["extract"]
+            for rev in p.get("revisions", [])[:1]:
+                page["wikitext"] = rev.get("slots", {}).get("main", {}).get("*") or page["wikitext"]
+            page["categories"] += [c["title"].split(":", 1)[-1] for c in p.get("categories", [])]
+            page["links"] += [l["title"] for l in p.get("links", [])]
+            page["pageprops"].update(p.get("pageprops", {}))
+        cont = data.get("continue")
+        if not cont:
+            break
+        props_pending = any(k in cont for k in ("clcontinue", "excontinue", "rvcontinue", "plcontinue"))
+        if limit is not None and len(pages) >= limit and not props_pending:
+            break
+        params = {**params, **cont}
+    return pages, alias
 
-# ---------- Parsing helpers ----------
-def extract_infobox(soup: BeautifulSoup):
-    for cls in ["infobox vcard", "infobox", "infobox vevent", "infobox hproduct"]:
-        tag = soup.find("table", {"class": lambda c: c and cls in c})
-        if tag:
-            return tag
-    return None
+def _pages_chunk(titles: List[str]) -> Dict[str, dict]:
+    pages, alias = _query_pages({"titles": "|".join(titles), "redirects": 1})
+    out = {}
+    for t in titles:
+        resolved = alias.get(t, t)
+        resolved = alias.get(resolved, resolved)  # normalized -> redirect target
+        if resolved in pages:
+            out[t] = pages[resolved]
+    return out
+
+def wiki_page_source(title: str) -> Dict:
+    """Full plaintext, wikitext, categories and article links for one page (PAGE_PROPS); no HTML."""
+    pages, _ = _query_pages({"titles": title, "redirects": 1}, max_rounds=10, props=PAGE_PROPS)
+    if not pages:
+        raise ValueError(f"Page not found: {title}")
+    return next(iter(pages.values()))
+
+def wiki_pages_bulk(titles: List[str]) -> Dict[str, dict]:
+    """
+    Intro plaintext, wikitext, categories and pageprops for many pages via multi-title queries.
+    Keyed by the requested title; each record carries the resolved 'title'. Never raises.
+    """
+    def fetch(chunk):
+        try:
+            return _pages_chunk(chunk)
+        except Exception:
+            return {}
 
-def get_infobox_text_map(infobox):
+    chunks = [titles[i:i + BULK_CHUNK] for i in range(0, len(titles), BULK_CHUNK)]
     out = {}
-    if not infobox:
-        return out
-    for row in infobox.find_all("tr"):
-        header, data = row.find("th"), row.find("td")
-        if header and data:
-            key = re.sub(r"\s+", " ", header.get_text(" ", strip=True)).lower()
-            val = re.sub(r"\s+", " ", data.get_text(" ", strip=True))
-            out[key] = val
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for part in ex.map(fetch, chunks):
+            out.update(part)
+    return out
+
+# ---------- Parsing helpers ----------
+INFOBOX_START_RX = re.compile(r"\{\{\s*infobox", re.IGNORECASE)
+WIKI_MARKUP_RX = re.compile(r"\{\{|\}\}|\[\[|\]\]|\|")
+
+def wikitext_infobox_map(wikitext: str) -> Dict[str, str]:
+    """Infobox params from article wikitext, keyed by lowercased name with spaces ("key people", ...)."""
+    m = INFOBOX_START_RX.search(wikitext)
+    if not m:
+        return {}
+    # Split the template on its own "|"s only: not inside nested {{ }} or [[a|b]] links,
+    # and stop at its closing braces so later templates' params don't leak in
+    parts, depth, links, start = [], 0, 0, m.start() + 2
+    for t in WIKI_MARKUP_RX.finditer(wikitext, m.start()):
+        tok = t.group()
+        if tok == "{{":
+            depth += 1
+        elif tok == "}}":
+            depth -= 1
+            if depth == 0:
+                break
+        elif tok == "[[":
+            links += 1
+        elif tok == "]]":
+            links = max(links - 1, 0)
+        elif depth == 1 and links == 0:
+            parts.append(wikitext[start:t.start()])
+            start = t.end()
+    parts.append(wikitext[start:t.start() if depth == 0 else len(wikitext)])
+    out = {}
+    for part in parts[1:]:  # parts[0] is the template name
+        name, eq, val = part.partition("=")
+        key = " ".join(name.replace("_", " ").split()).lower()
+        if eq and key:
+            out[key] = " ".join(val.split())
     return out
 
-def looks_like_company_page(soup: BeautifulSoup) -> bool:
-    text = soup.get_text(" ", strip=True).lower()
-    return any(k in text for k in ["industry", "founded", "headquarters", "revenue", "number of employees"])
+def looks_like_company_text(low: str) -> bool:
+    """`low` must already be lowercased."""
+    return any(k in low for k in ["industry", "founded", "headquarters", "revenue", "number of employees"])
 
 # ---------- PE detection ----------
+def _scan_pe_firms(hay: str) -> Optional[str]:
+    """Substring scan for KNOWN_PE_FIRMS; cheap enough for short text like infobox fields."""
+    for pe in _PE_FIRMS_SORTED:
+        if pe in hay:
+            return pe
+    return None
+
+def find_pe_firm(hay: str) -> Optional[str]:
+    """First KNOWN_PE_FIRMS name found in an already-lowercased haystack, or None."""
+    if PE_FIRMS_AC is not None:
+        for _, firm in PE_FIRMS_AC.iter(hay):
+            return firm
+        return None
+    return _scan_pe_firms(hay)
+
+def pe_keyword_search(low: str) -> bool:
+    """True if any PE_KEYWORDS pattern occurs in the lowercased text; Hyperscan when available."""
+    if PE_HS_DB is None:
+        return PE_RX.search(low) is not None
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(PE_HS_DB)
+    hits = []
+
+    def on_match(id_, start, end, flags, context):
+        hits.append(id_)
+        return True  # stop at the first match
+
+    try:
+        PE_HS_DB.scan(low.encode("utf-8", "ignore"), match_event_handler=on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        pass
+    return bool(hits)
+
 def is_pe_owned_from_infobox(info):
     fields = ["owner", "owners", "parent company", "parent", "owner(s)", "key people"]
     hay = " ".join([info.get(f, "") for f in fields]).lower()
-    for kw in PE_KEYWORDS:
-        if re.search(kw, hay, re.I):
-            return True, "Infobox indicates private equity."
-    if any(pe in hay for pe in KNOWN_PE_FIRMS):
+    if PE_RX.search(hay):
+        return True, "Infobox indicates private equity."
+    if _scan_pe_firms(hay):
         return True, "Infobox lists a known PE firm."
     return False, ""
 
-def is_pe_owned_from_body(text: str):
-    low = text.lower()
-    for kw in PE_KEYWORDS:
-        if re.search(kw, low, re.I):
-            return True, "Article mentions private equity."
-    if any(pe in low for pe in KNOWN_PE_FIRMS):
+def is_pe_owned_from_body(low: str):
+    """`low` must already be lowercased."""
+    if pe_keyword_search(low):
+        return True, "Article mentions private equity."
+    if find_pe_firm(low):
         return True, "Article names a known PE firm."
     if ("acquired" in low or "buyout" in low) and ("private" in low and "equity" in low):
         return True, "Article describes a PE acquisition."
     return False, ""
 
-def detect_industry_categories(meta: Dict):
-    cats = [c.get("*") for c in meta.get("categories", []) if c.get("*")]
-    links = [l.get("*") for l in meta.get("links", []) if l.get("ns") == 0 and l.get("*")]
-    industry = [c for c in cats if any(t in c.lower() for t in [
+def detect_industry_categories(cats: List[str]) -> List[str]:
+    return [c for c in cats if any(t in c.lower() for t in [
         "companies", "manufacturers", "retail", "technology", "software", "telecommunications",
         "energy", "food", "beverage", "transport", "healthcare", "pharmaceutical", "financial", "bank", "insurance"
     ])]
-    return industry, links
 
-def extract_body_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    content = soup.find("div", {"class": "mw-parser-output"})
-    return re.sub(r"\s+", " ", content.get_text(" ", strip=True)) if content else soup.get_text(" ", strip=True)
+def _parse_page(title: str) -> BeautifulSoup:
+    return BeautifulSoup(wiki_page_parse(title)["text"]["*"], HTML_PARSER)
+
+def get_page_soup(title: str) -> BeautifulSoup:
+    """Parsed HTML of a page (used for list pages); fetched and parsed once while cached."""
+    return cache_call(("soup", title), _parse_page, title)
 
 # ---------- Main logic ----------
-@lru_cache(maxsize=512)
+@st.cache_data(ttl=CACHE_TTL, max_entries=512, show_spinner=False)
 def get_page_pe_status(title: str) -> Dict:
-    html = wiki_page_html(title)
-    soup = BeautifulSoup(html, "html.parser")
-
-    info = get_infobox_text_map(extract_infobox(soup))
-    body_text = extract_body_text(html)
+    page = wiki_page_source(title)
+    info = wikitext_infobox_map(page["wikitext"])
 
-    pe1, why1 = is_pe_owned_from_infobox(info)
-    pe2, why2 = is_pe_owned_from_body(body_text)
-    is_pe = pe1 or pe2
-    reason = why1 or why2 or "No PE indicators."
-
-    meta = wiki_page_metadata(title)
-    cats, links = detect_industry_categories(meta)
+    # The body is only scanned when the infobox is inconclusive
+    is_pe, reason = is_pe_owned_from_infobox(info)
+    if not is_pe:
+        is_pe, why = is_pe_owned_from_body((page["extract"] or page["wikitext"]).lower())
+        reason = why or "No PE indicators."
 
     return {
-        "title": title,
-        "url": WIKI_BASE + title.replace(" ", "_"),
+        "title": page["title"],
+        "url": WIKI_BASE + page["title"].replace(" ", "_"),
         "is_pe": is_pe,
         "reason": reason,
         "infobox": info,
-        "categories": cats,
-        "links": links
+        "categories": detect_industry_categories(page["categories"]),
+        "links": page["links"],
     }
 
-def category_members(category_name: str, max_items: int = 20) -> List[str]:
-    out, cmcontinue, tries = [], None, 0
-    while len(out) < max_items and tries < 5:
-        params = {
-            "action": "query",
-            "list": "categorymembers",
-            "cmtitle": f"Category:{category_name}",
-            "cmlimit": min(50, max_items - len(out)),
-            "format": "json"
-        }
-        if cmcontinue:
-            params["cmcontinue"] = cmcontinue
-        r = _http_get(WIKI_API, params=params, timeout=15)
-        data = r.json()
-        members = data.get("query", {}).get("categorymembers", [])
-        for m in members:
-            if m.get("ns") == 0:
-                out.append(m["title"])
-        cmcontinue = data.get("continue", {}).get("cmcontinue")
-        if not cmcontinue:
-            break
-        tries += 1
-    return out
+def summary_pe_status(page: Dict) -> Dict:
+    """get_page_pe_status equivalent for a wiki_pages_bulk record (wikitext + categories), no HTTP."""
+    cats = page["categories"]
+    info = wikitext_infobox_map(page["wikitext"])
+    extract_low, cats_low = page["extract"].lower(), " ".join(cats).lower()
 
-def find_candidate_peers(seed_title: str, categories: List[str], limit: int = 40) -> List[str]:
-    peers = []
-    top = categories[:2] if categories else []
-    for cat in top:
-        peers += category_members(cat, max_items=limit // 2)
+    is_pe, why = is_pe_owned_from_infobox(info)
+    if not is_pe:
+        body_low = (page["wikitext"] or page["extract"]).lower()
+        is_pe, why = is_pe_owned_from_body(body_low + " " + cats_low)
+    return {
+        "title": page["title"],
+        "url": WIKI_BASE + page["title"].replace(" ", "_"),
+        "is_pe": is_pe,
+        "reason": why or "No PE indicators.",
+        "categories": cats,
+        "is_company": "disambiguation" not in page["pageprops"] and (
+            looks_like_company_text(" ".join(info) + " " + extract_low) or "companies" in cats_low
+        ),
+    }
 
-    # Try to leverage "List of ... companies" pages linked from the article
+@st.cache_data(ttl=CACHE_TTL, max_entries=128, show_spinner=False)
+def wiki_category_bulk(category_name: str, limit: int = 20) -> List[Dict]:
+    """
+    summary_pe_status for the article members of a category, via generator=categorymembers
+    (one request per 20 members instead of 1 + N). Only the small derived dicts are cached,
+    not the members' wikitext.
+    """
+    pages, _ = _query_pages({
+        "generator": "categorymembers",
+        "gcmtitle": f"Category:{category_name}",
+        "gcmnamespace": 0,
+        "gcmlimit": min(BULK_CHUNK, limit),
+        "redirects": 1,  # members that are redirects come back as their target article
+    }, limit=limit)
+    return [summary_pe_status(page) for page in list(pages.values())[:limit]]
+
+def list_page_peers(seed_title: str, limit: int = 40, max_tries: int = 3) -> List[str]:
+    """Company links from the first "List of ... companies" page the seed links to; never raises."""
+    out = []
+    # The seed's links come from its cached status, so the page isn't re-fetched.
     try:
-        seed_html = wiki_page_html(seed_title)
-        soup = BeautifulSoup(seed_html, "html.parser")
-        for a in soup.select("a[href^='/wiki/']"):
-            t = a.get("title") or ""
-            if t.lower().startswith("list of") and "companies" in t.lower():
-                # Quick scrape of company links from that list page
-                try:
-                    html = wiki_page_html(t)
-                    soup_list = BeautifulSoup(html, "html.parser")
-                    for a2 in soup_list.select("div.mw-parser-output a[href^='/wiki/']"):
-                        tt = a2.get("title")
-                        if tt and ":" not in tt and not tt.startswith("List of"):
-                            peers.append(tt)
-                            if len(peers) >= limit:
-                                break
-                except Exception:
-                    pass
-                break
+        lists = [t for t in get_page_pe_status(seed_title)["links"] if LIST_RX.match(t)]
     except Exception:
-        pass
+        return out
+    # prop=links doesn't say which links are red, so move on to the next list if one won't parse
+    for t in lists[:max_tries]:
+        try:
+            soup_list = get_page_soup(t)
+        except Exception:
+            continue
+        # Quick scrape of company links from that list page
+        for a2 in soup_list.select("div.mw-parser-output a[href^='/wiki/']"):
+            tt = a2.get("title")
+            if tt and ":" not in tt and not tt.startswith("List of"):
+                out.append(tt)
+                if len(out) >= limit:
+                    break
+        break
+    return out
+
+def find_candidate_peers(seed_title: str, categories: List[str], limit: int = 40) -> List[Tuple[str, Optional[Dict]]]:
+    """
+    Candidate peers as (title, status) pairs. Category members already carry their
+    summary_pe_status; list-page links come with None and are fetched later.
+    """
+    top = categories[:2] if categories else []
+    # Category lookups and the list-page scrape are independent, so run them all at once.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        cat_jobs = [ex.submit(wiki_category_bulk, c, limit=limit // 2) for c in top]
+        list_job = ex.submit(list_page_peers, seed_title, limit)
+        peers = [(s["title"], s) for job in cat_jobs for s in job.result()]
+        peers += [(t, None) for t in list_job.result()]
 
     # De-dup & remove seed
     dd, seen = [], set()
-    for p in peers:
-        if p and p != seed_title and p not in seen:
-            seen.add(p)
-            dd.append(p)
+    for t, status in peers:
+        if t and t != seed_title and t not in seen:
+            seen.add(t)
+            dd.append((t, status))
     return dd[:limit]
 
-def filter_non_pe(peers: List[str], max_keep: int = 12) -> List[Dict]:
-    res = []
-    for t in peers:
-        try:
-            s = get_page_pe_status(t)
-            html = wiki_page_html(t)
-            soup = BeautifulSoup(html, "html.parser")
-            if s["is_pe"]:
-                continue
-            if not looks_like_company_page(soup):
-                continue
-            res.append({"title": s["title"], "url": s["url"]})
-            time.sleep(0.4)  # be gentle to the API
-            if len(res) >= max_keep:
-                break
-        except Exception:
+def filter_non_pe(peers: List[Tuple[str, Optional[Dict]]], max_keep: int = 12) -> List[Dict]:
+    res, seen = [], set()
+    # Only peers without a status need fetching (one bulk call); the checks below run locally.
+    fetched = wiki_pages_bulk([t for t, status in peers if status is None])
+    for t, s in peers:
+        if s is None:
+            page = fetched.get(t)
+            s = summary_pe_status(page) if page else None
+        if not s or s["title"] in seen:
+            continue
+        seen.add(s["title"])
+        if s["is_pe"] or not s["is_company"]:
             continue
+        res.append({"title": s["title"], "url": s["url"]})
+        if len(res) >= max_keep:
+            break
     return res
 
 # ---------- Streamlit UI ----------